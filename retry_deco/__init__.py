@@ -1 +1 @@
-from retry_deco.retry import E, C, N, X, OnEx, DEFAULT_ONEX_OPTS, OnErrOpts, Retry, RetryAsync, retry
+from retry_deco.retry import E, C, N, X, J, OnEx, DEFAULT_ONEX_OPTS, OnErrOpts, Retry, RetryAsync, retry
@@ -1,13 +1,15 @@
 import asyncio
 import logging
-import random
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from enum import IntFlag
-from functools import partial, wraps
-from inspect import iscoroutinefunction
-from typing import Any
+from functools import lru_cache, partial, wraps
+from inspect import CO_COROUTINE, iscoroutinefunction
+from itertools import count as count_from
+from random import random as _rand
+from types import FunctionType
+from typing import Any, ClassVar, Literal
 
 logger = logging.getLogger(__name__)
 
@@ -19,116 +21,198 @@ class OnErrOpts(IntFlag):
 
 
 DEFAULT_ONEX_OPTS = OnErrOpts(0)
+DECORRELATED_JITTER = "decorrelated"
+# plain int values of the flags; bitwise ops on these don't allocate new OnErrOpts members
+RUN_ON_LAST_TRY_BIT = OnErrOpts.RUN_ON_LAST_TRY.value
+BREAK_OUT_BIT = OnErrOpts.BREAK_OUT.value
+EXP_BACKOFF_TABLE_SIZE = 64  # max amount of precomputed exponential backoffs
+DELAY_FN_CACHE_SIZE = 32  # max amount of distinct backoff configs to keep delay functions for
 
 E = type[BaseException]
 C = Callable[..., Any | Awaitable[Any]]
 N = int | float  # number
 X = Callable[[E], Any]
+J = N | tuple[N, N] | Literal["decorrelated"]  # jitter
 OnEx = dict[E, C | tuple[C, OnErrOpts]]
+OnExItems = tuple[tuple[E, C, bool, bool], ...]  # (error_type, callback, run_on_last_try, break_out)
 
 
 def get_fn_name(f: C) -> str:
-    if isinstance(f, partial):
-        return get_fn_name(f.func)
+    while isinstance(f, partial):
+        f = f.func
     return getattr(f, "__name__", f.__class__.__name__)  # from https://github.com/Kludex/starlette/pull/2648
 
 
-def attempts_exceeded(f: C, count: int):
-    logger.error(f"exceeded {count} attempts for {get_fn_name(f)}")
+def is_coroutine_fn(f: Any) -> bool:
+    """inspect.iscoroutinefunction(), short-circuited for plain functions by checking their code flags directly.
+
+    Anything else (partials, methods, mocks, functions marked via inspect.markcoroutinefunction)
+    is left for inspect to figure out.
+    """
+    if type(f) is FunctionType and "_is_coroutine_marker" not in f.__dict__:
+        return bool(f.__code__.co_flags & CO_COROUTINE)
+    return iscoroutinefunction(f)
+
+
+def attempts_exceeded(fn_name: str, count: int):
+    logger.error("exceeded %d attempts for %s", count, fn_name)
+
+
+def chain_context(ex: BaseException, context: BaseException) -> None:
+    """Link context into the implicit chain of ex, as if ex was raised while context was being handled.
+
+    Callbacks and on_exhaustion are invoked outside the except block that caught context.
+    """
+    while ex is not context:
+        if ex.__context__ is None:
+            ex.__context__ = context
+            return
+        ex = ex.__context__
 
 
 def validate_backoff(
     backoff: N,
     exponential_backoff: bool,
     max_backoff: N,
-    jitter: N | tuple[N, N],
+    jitter: J,
 ):
+    if jitter == DECORRELATED_JITTER:
+        if exponential_backoff:
+            raise ValueError("decorrelated jitter grows backoff itself, drop exponential_backoff.")
+        if backoff <= 0:
+            raise ValueError("with decorrelated jitter backoff must be greater than 0.")
+        if max_backoff and max_backoff <= backoff:
+            raise ValueError("max_backoff must be greater than backoff.")
+        return
+
     if exponential_backoff:
-        assert backoff > 0, "with exponential_backoff backoff must be greater than 0."
-        if max_backoff:
-            assert max_backoff > backoff, "max_backoff must be greater than backoff."
+        if backoff <= 0:
+            raise ValueError("with exponential_backoff backoff must be greater than 0.")
+        if max_backoff and max_backoff <= backoff:
+            raise ValueError("max_backoff must be greater than backoff.")
     else:
-        assert backoff >= 0, "backoff must be >= 0."
-        assert not max_backoff, "max_backoff does not make sense without exponential_backoff."
+        if backoff < 0:
+            raise ValueError("backoff must be >= 0.")
+        if max_backoff:
+            raise ValueError("max_backoff does not make sense without exponential_backoff or decorrelated jitter.")
 
     if jitter:
         if isinstance(jitter, tuple):
-            assert len(jitter) == 2, "jitter, when defined as a tuple, must be a range of length 2"
+            if len(jitter) != 2:
+                raise ValueError("jitter, when defined as a tuple, must be a range of length 2")
             # j = max([abs(x) for x in jitter])
             j = max(abs(jitter[0]), abs(jitter[1]))
         else:
             j = abs(jitter)
-        assert j <= backoff, "jitter extreme must be <= backoff."
+        if j > backoff:
+            raise ValueError("jitter extreme must be <= backoff.")
 
 
 def sanitize_on_exception(onex: None | OnEx | tuple[C, OnErrOpts] | C, is_async: bool) -> OnEx:
-    def assert_callable(c):
+    def check_callable(c):
         if is_async:
-            assert iscoroutinefunction(c), "on_exception must be async as decorating function"
+            if not is_coroutine_fn(c):
+                raise TypeError("on_exception must be async as decorating function")
         else:
-            assert not iscoroutinefunction(c), "on_exception must not be async as decorating function"
-            assert callable(c), "c must be callable"
-
-    def assert_iter(i):
-        assert len(i) == 2, "on_exception tuple needs to be of length 2"
-        assert isinstance(i[1], OnErrOpts), "second item in on_exception tuple must be OnErrOpts"
-        assert_callable(i[0])
+            if is_coroutine_fn(c):
+                raise TypeError("on_exception must not be async as decorating function")
+            if not callable(c):
+                raise TypeError("c must be callable")
+
+    def check_iter(i):
+        if len(i) != 2:
+            raise ValueError("on_exception tuple needs to be of length 2")
+        if not isinstance(i[1], OnErrOpts):
+            raise TypeError("second item in on_exception tuple must be OnErrOpts")
+        check_callable(i[0])
 
     if onex is None:
         return {}
     elif isinstance(onex, dict):
         for c in onex.values():
             if isinstance(c, tuple):
-                assert_iter(c)
+                check_iter(c)
             else:
-                assert_callable(c)
+                check_callable(c)
         return onex
     elif callable(onex):
-        assert_callable(onex)
+        check_callable(onex)
         return {Exception: onex}
     else:  # i.e.  elif isinstance(onex, tuple):
-        assert_iter(onex)
+        check_iter(onex)
         return {Exception: onex}
 
 
-def handle_delay(
-    exception: E,
-    count: int,
-    retries: int,
-    attempts: int,
-    on_exhaustion: bool | X,
+@lru_cache(maxsize=DELAY_FN_CACHE_SIZE)
+def get_delay_fn(
     backoff: N,
     exponential_backoff: bool,
     max_backoff: N,
-    jitter: N | tuple[N, N],
-    function: C,
-) -> tuple[int, float, Any]:
-    count += 1
-    logger.warning(f"{count}. attempt: caught error in [{get_fn_name(function)}]: {repr(exception)}")
-
-    if retries != -1 and count >= attempts:
-        if on_exhaustion:
-            if on_exhaustion is True:
-                return count, 0, exception
-            return count, 0, on_exhaustion(exception)
-        raise exception
+    jitter: J,
+    retries: int,
+) -> Callable[[int, float], float]:
+    """Build function returning the backoff for given attempt count and previous backoff.
+
+    Config is fixed at decoration time, so branches not applicable to it are
+    resolved here once instead of on every retry. Recent results are cached, meaning
+    decorators with identical config share the same function.
+    """
+    if jitter == DECORRELATED_JITTER:
+        # sleep = min(cap, uniform(base, prev_sleep * 3)), where the first prev_sleep is base
+        cap = max_backoff or float("inf")
+
+        def decorrelated(count: int, prev: float) -> float:
+            return min(backoff + _rand() * (max(prev, backoff) * 3 - backoff), cap)
+
+        return decorrelated
 
-    current_backoff: float = backoff
     if exponential_backoff:
-        current_backoff *= 2 ** (count - 1)
+        # backoff * 2 ** (count - 1) lookup table; exponent is capped for infinite or very large retries
+        size = EXP_BACKOFF_TABLE_SIZE if retries == -1 else min(retries, EXP_BACKOFF_TABLE_SIZE)
+        cap = max_backoff if max_backoff and not jitter else float("inf")
+        table = tuple(min(backoff * (1 << i), cap) for i in range(size))
+
+    if not jitter:
+        if not exponential_backoff:
+            return lambda count, prev: backoff
+        return lambda count, prev: table[count - 1 if count <= size else -1]
+
+    # normalize both jitter forms into a low + random() * width range
+    if isinstance(jitter, tuple):
+        low, width = jitter[0], jitter[1] - jitter[0]
+    else:
+        low, width = -jitter, 2 * jitter
 
-    if jitter:
-        if isinstance(jitter, tuple):
-            current_backoff += random.uniform(*jitter)
-        else:
-            # deviation = jitter * random.random() * random.choice((-1, 1))
-            # deviation = jitter * (-1 + 2 * random.random())
-            deviation = jitter * random.uniform(-1, 1)
-            current_backoff += deviation
-    if max_backoff:
-        current_backoff = min(current_backoff, max_backoff)
+    if not exponential_backoff:
+        low += backoff
+
+        def delay(count: int, prev: float) -> float:
+            return max(low + _rand() * width, 0.0)
+    elif max_backoff:
+
+        def delay(count: int, prev: float) -> float:
+            return max(min(table[count - 1 if count <= size else -1] + low + _rand() * width, max_backoff), 0.0)
+    else:
+
+        def delay(count: int, prev: float) -> float:
+            return max(table[count - 1 if count <= size else -1] + low + _rand() * width, 0.0)
 
-    return count, current_backoff, None
+    return delay
+
+
+def handle_exhaustion(exception: BaseException, count: int, on_exhaustion: bool | X, fn_name: str) -> Any:
+    if not on_exhaustion:
+        raise exception
+    if on_exhaustion is True:
+        return_val = exception
+    else:
+        try:
+            return_val = on_exhaustion(exception)
+        except BaseException as cb_ex:
+            chain_context(cb_ex, exception)
+            raise
+    attempts_exceeded(fn_name, count)
+    return return_val
 
 
 def unpack_callback(cb: tuple[C, OnErrOpts] | C) -> tuple[C, OnErrOpts]:
@@ -139,97 +223,137 @@ def unpack_callback(cb: tuple[C, OnErrOpts] | C) -> tuple[C, OnErrOpts]:
 
 
 def should_skip_cb(opts: OnErrOpts, last_try: bool) -> bool:
-    return last_try and not bool(opts & OnErrOpts.RUN_ON_LAST_TRY)
+    return last_try and not opts & RUN_ON_LAST_TRY_BIT
+
+
+def get_onex_items(onex: OnEx) -> OnExItems:
+    """Unpack sanitized on_exception mapping once, so retry loops needn't do it per caught exception."""
+    items = []
+    for error_type, callback in onex.items():
+        cb, opts = unpack_callback(callback)
+        bits = opts.value
+        items.append((error_type, cb, bool(bits & RUN_ON_LAST_TRY_BIT), bool(bits & BREAK_OUT_BIT)))
+    return tuple(items)
 
 
 def retry_logic(
     f: Callable[..., Any],
+    args: tuple,
+    kwargs: dict[str, Any],
+    e: BaseException,
     expected_exception: E | tuple[E, ...],
     retries: int,
-    backoff: N,
-    exponential_backoff: bool,
     on_exhaustion: bool | X,
-    jitter: N | tuple[N, N],
-    max_backoff: N,
-    onex: OnEx,
+    delay: Callable[[int, float], float],
+    onex_items: OnExItems,
+    drop_tb: bool,
 ) -> Any:
-    count = 0
-    attempts = retries + 1
-    while retries == -1 or count < attempts:
+    """Slow path, entered once the first call of f(*args, **kwargs) has already failed with e."""
+    fn_name = get_fn_name(f)
+    current_backoff = 0.0
+    for count in range(1, retries + 1) if retries != -1 else count_from(1):
+        # check if this exception is something the caller wants special handling for;
+        # most callers don't register any callbacks, so don't even set up the loop then
+        if onex_items:
+            try:
+                for error_type, cb, _, break_out in onex_items:
+                    if isinstance(e, error_type):
+                        cb()
+                        if break_out:
+                            break
+            except BaseException as cb_ex:
+                chain_context(cb_ex, e)
+                raise
+
+        logger.warning("%d. attempt: caught error in [%s]: %r", count, fn_name, e)
+        if drop_tb:
+            # e is retained until the next attempt; don't keep its frames alive while backing off
+            e.__traceback__ = None
+        current_backoff = delay(count, current_backoff)
+        if current_backoff:
+            time.sleep(current_backoff)
+
         try:
-            return f()
-        except expected_exception as e:
-            # check if this exception is something the caller wants special handling for
-            for error_type in onex:
-                if isinstance(e, error_type):
-                    cb, opts = unpack_callback(onex[error_type])
-                    if should_skip_cb(opts, count == retries):
-                        continue
-                    cb()
-                    if opts & OnErrOpts.BREAK_OUT:
-                        break
-
-            count, current_backoff, return_val = handle_delay(
-                e,
-                count,
-                retries,
-                attempts,
-                on_exhaustion,
-                backoff,
-                exponential_backoff,
-                max_backoff,
-                jitter,
-                f,
-            )
-            if current_backoff:
-                time.sleep(current_backoff)
-    attempts_exceeded(f, count)
-    return return_val
+            return f(*args, **kwargs)
+        except expected_exception as ex:
+            e = ex
+
+    # no attempts remaining
+    try:
+        for error_type, cb, run_on_last_try, break_out in onex_items:
+            if isinstance(e, error_type):
+                if not run_on_last_try:
+                    continue
+                cb()
+                if break_out:
+                    break
+    except BaseException as cb_ex:
+        chain_context(cb_ex, e)
+        raise
+
+    logger.warning("%d. attempt: caught error in [%s]: %r", retries + 1, fn_name, e)
+    return handle_exhaustion(e, retries + 1, on_exhaustion, fn_name)
 
 
 async def retry_logic_async(
     f: Callable[..., Awaitable[Any]],
+    args: tuple,
+    kwargs: dict[str, Any],
+    e: BaseException,
     expected_exception: E | tuple[E, ...],
     retries: int,
-    backoff: N,
-    exponential_backoff: bool,
     on_exhaustion: bool | X,
-    jitter: N | tuple[N, N],
-    max_backoff: N,
-    onex: OnEx,
+    delay: Callable[[int, float], float],
+    onex_items: OnExItems,
+    drop_tb: bool,
 ) -> Any:
-    count = 0
-    attempts = retries + 1
-    while retries == -1 or count < attempts:
+    """Slow path, entered once the first call of f(*args, **kwargs) has already failed with e."""
+    fn_name = get_fn_name(f)
+    current_backoff = 0.0
+    for count in range(1, retries + 1) if retries != -1 else count_from(1):
+        # check if this exception is something the caller wants special handling for;
+        # most callers don't register any callbacks, so don't even set up the loop then
+        if onex_items:
+            try:
+                for error_type, cb, _, break_out in onex_items:
+                    if isinstance(e, error_type):
+                        await cb()
+                        if break_out:
+                            break
+            except BaseException as cb_ex:
+                chain_context(cb_ex, e)
+                raise
+
+        logger.warning("%d. attempt: caught error in [%s]: %r", count, fn_name, e)
+        if drop_tb:
+            # e is retained until the next attempt; don't keep its frames alive while backing off
+            e.__traceback__ = None
+        # asyncio.sleep() keeps the event loop unblocked while backing off, but even a 0 delay
+        # costs a loop iteration; skip it as there's nothing to wait for
+        current_backoff = delay(count, current_backoff)
+        if current_backoff:
+            await asyncio.sleep(current_backoff)
+
         try:
-            return await f()
-        except expected_exception as e:
-            # check if this exception is something the caller wants special handling for
-            for error_type in onex:
-                if isinstance(e, error_type):
-                    cb, opts = unpack_callback(onex[error_type])
-                    if should_skip_cb(opts, count == retries):
-                        continue
-                    await cb()
-                    if opts & OnErrOpts.BREAK_OUT:
-                        break
-
-            count, current_backoff, return_val = handle_delay(
-                e,
-                count,
-                retries,
-                attempts,
-                on_exhaustion,
-                backoff,
-                exponential_backoff,
-                max_backoff,
-                jitter,
-                f,
-            )
-            if current_backoff:
-                await asyncio.sleep(current_backoff)
-    attempts_exceeded(f, count)
-    return return_val
+            return await f(*args, **kwargs)
+        except expected_exception as ex:
+            e = ex
+
+    # no attempts remaining
+    try:
+        for error_type, cb, run_on_last_try, break_out in onex_items:
+            if isinstance(e, error_type):
+                if not run_on_last_try:
+                    continue
+                await cb()
+                if break_out:
+                    break
+    except BaseException as cb_ex:
+        chain_context(cb_ex, e)
+        raise
+
+    logger.warning("%d. attempt: caught error in [%s]: %r", retries + 1, fn_name, e)
+    return handle_exhaustion(e, retries + 1, on_exhaustion, fn_name)
 
 
 def retry(
@@ -239,9 +363,10 @@ def retry(
     backoff: N = 0,
     exponential_backoff: bool = False,
     on_exhaustion: bool | X = False,
-    jitter: N | tuple[N, N] = 0,
+    jitter: J = 0,
     max_backoff: N = 0,
     on_exception: None | OnEx | tuple[C, OnErrOpts] | C = None,
+    drop_tb: bool = True,
 ):
     """Retry decorator for synchronous and asynchronous functions.
 
@@ -267,6 +392,10 @@ def retry(
             maximum value of deviation from the current_backoff.
             - if a number, then jitter will be in the range (-value, value)
             - if a (min, max) tuple then it defines the range to generate jitter from.
+            - if "decorrelated", then current_backoff = uniform(backoff, previous_backoff * 3),
+              capped by max_backoff. Sleeps grow on their own, but unlike exponential_backoff
+              they're spread apart between callers, avoiding synchronized retry storms against
+              a shared backend. Can't be combined with exponential_backoff.
             default: 0
         max_backoff:
             current_backoff = min(current_backoff, max_backoff).
@@ -283,48 +412,64 @@ def retry(
             Be aware if the decorated function is synchronous, on_exception function(s)
             must be synchronous as well and vice versa: for async function they need
             to be asynchronous. default: None
+        drop_tb:
+            clear the traceback of exceptions caught on non-final attempts before backing off,
+            so their frames aren't kept alive during the sleep. The exception that is finally
+            raised or returned keeps its traceback. default: True
     """
 
     validate_backoff(backoff, exponential_backoff, max_backoff, jitter)
-    assert isinstance(on_exhaustion, bool) or not iscoroutinefunction(on_exhaustion), (
-        "on_exhaustion can either be bool or synchronous function"
-    )
+    if not isinstance(on_exhaustion, bool) and is_coroutine_fn(on_exhaustion):
+        raise TypeError("on_exhaustion can either be bool or synchronous function")
+
+    delay = get_delay_fn(backoff, exponential_backoff, max_backoff, jitter, retries)
 
     def decorator(f: C) -> C:
-        if iscoroutinefunction(f):
+        if is_coroutine_fn(f):
             is_async = True
         else:
             is_async = False
-            assert callable(f), "function must be callable"
+            if not callable(f):
+                raise TypeError("function must be callable")
 
-        onex: OnEx = sanitize_on_exception(on_exception, is_async)
+        onex_items: OnExItems = get_onex_items(sanitize_on_exception(on_exception, is_async))
 
         @wraps(f)
         def wrapper(*args, **kwargs) -> Any:
+            try:
+                return f(*args, **kwargs)
+            except expected_exception as e:
+                exc = e
             return retry_logic(
-                partial(f, *args, **kwargs),
+                f,
+                args,
+                kwargs,
+                exc,
                 expected_exception,
                 retries,
-                backoff,
-                exponential_backoff,
                 on_exhaustion,
-                jitter,
-                max_backoff,
-                onex,
+                delay,
+                onex_items,
+                drop_tb,
             )
 
         @wraps(f)
         async def async_wrapper(*args, **kwargs) -> Any:
+            try:
+                return await f(*args, **kwargs)
+            except expected_exception as e:
+                exc = e
             return await retry_logic_async(
-                partial(f, *args, **kwargs),
+                f,
+                args,
+                kwargs,
+                exc,
                 expected_exception,
                 retries,
-                backoff,
-                exponential_backoff,
                 on_exhaustion,
-                jitter,
-                max_backoff,
-                onex,
+                delay,
+                onex_items,
+                drop_tb,
             )
 
         return async_wrapper if is_async else wrapper
@@ -339,38 +484,73 @@ class BaseRetry(ABC):
 
     __slots__ = [
         "expected_exception",
-        "retries",
-        "backoff",
-        "exponential_backoff",
+        "_retries",
+        "_backoff",
+        "_exponential_backoff",
         "on_exhaustion",
-        "jitter",
-        "max_backoff",
-        "on_exception",
+        "_jitter",
+        "_max_backoff",
+        "_on_exception",
+        "drop_tb",
+        "_onex_items",
+        "_delay",
     ]
 
+    is_async: ClassVar[bool]
+
     def __init__(
         self,
-        expected_exception: E | tuple[E, ...],
-        retries: int,
-        backoff: N,
-        exponential_backoff: bool,
-        on_exhaustion: bool | X,
-        jitter: N | tuple[N, N],
-        max_backoff: N,
-        on_exception: OnEx,
+        expected_exception: E | tuple[E, ...] = Exception,
+        *,
+        retries: int = 1,
+        backoff: N = 0,
+        exponential_backoff: bool = False,
+        on_exhaustion: bool | X = False,
+        jitter: J = 0,
+        max_backoff: N = 0,
+        on_exception: None | OnEx | tuple[C, OnErrOpts] | C = None,
+        drop_tb: bool = True,
     ):
         validate_backoff(backoff, exponential_backoff, max_backoff, jitter)
 
         self.expected_exception = expected_exception
-        self.retries = retries
-        self.backoff = backoff
-        self.exponential_backoff = exponential_backoff
+        self._retries = retries
+        self._backoff = backoff
+        self._exponential_backoff = exponential_backoff
         self.on_exhaustion = on_exhaustion
-        self.jitter = jitter
-        self.max_backoff = max_backoff
-        self.on_exception = on_exception
+        self._jitter = jitter
+        self._max_backoff = max_backoff
+        self._on_exception = sanitize_on_exception(on_exception, self.is_async)
+        self._onex_items = get_onex_items(self._on_exception)
+        self.drop_tb = drop_tb
+        self._delay = get_delay_fn(backoff, exponential_backoff, max_backoff, jitter, retries)
         super().__init__()
 
+    # backoff config is baked into _delay and on_exception into _onex_items at construction time, hence read-only
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def backoff(self) -> N:
+        return self._backoff
+
+    @property
+    def exponential_backoff(self) -> bool:
+        return self._exponential_backoff
+
+    @property
+    def jitter(self) -> J:
+        return self._jitter
+
+    @property
+    def max_backoff(self) -> N:
+        return self._max_backoff
+
+    @property
+    def on_exception(self) -> OnEx:
+        return self._on_exception
+
     @abstractmethod
     def __call__(self, f: C, *args, **kwargs) -> Any:
         pass
@@ -381,51 +561,26 @@ class Retry(BaseRetry):
     Class supporting a more programmatic approach, i.e. w/o a decorator, for retrying logic.
     """
 
-    __slots__ = [
-        "expected_exception",
-        "retries",
-        "backoff",
-        "exponential_backoff",
-        "on_exhaustion",
-        "jitter",
-        "max_backoff",
-        "on_exception",
-    ]
+    __slots__ = ()
 
-    def __init__(
-        self,
-        expected_exception: E | tuple[E, ...] = Exception,
-        *,
-        retries: int = 1,
-        backoff: N = 0,
-        exponential_backoff: bool = False,
-        on_exhaustion: bool | X = False,
-        jitter: N | tuple[N, N] = 0,
-        max_backoff: N = 0,
-        on_exception: None | OnEx | tuple[C, OnErrOpts] | Callable[..., Any] = None,
-    ):
-        super().__init__(
-            expected_exception,
-            retries,
-            backoff,
-            exponential_backoff,
-            on_exhaustion,
-            jitter,
-            max_backoff,
-            sanitize_on_exception(on_exception, False),
-        )
+    is_async = False
 
     def __call__(self, f: Callable[..., Any], *args, **kwargs) -> Any:
+        try:
+            return f(*args, **kwargs)
+        except self.expected_exception as e:
+            exc = e
         return retry_logic(
-            partial(f, *args, **kwargs),
+            f,
+            args,
+            kwargs,
+            exc,
             self.expected_exception,
-            self.retries,
-            self.backoff,
-            self.exponential_backoff,
+            self._retries,
             self.on_exhaustion,
-            self.jitter,
-            self.max_backoff,
-            self.on_exception,
+            self._delay,
+            self._onex_items,
+            self.drop_tb,
         )
 
 
@@ -434,49 +589,24 @@ class RetryAsync(BaseRetry):
     Class supporting a more programmatic approach, i.e. w/o a decorator, for retrying logic.
     """
 
-    __slots__ = [
-        "expected_exception",
-        "retries",
-        "backoff",
-        "exponential_backoff",
-        "on_exhaustion",
-        "jitter",
-        "max_backoff",
-        "on_exception",
-    ]
+    __slots__ = ()
 
-    def __init__(
-        self,
-        expected_exception: E | tuple[E, ...] = Exception,
-        *,
-        retries: int = 1,
-        backoff: N = 0,
-        exponential_backoff: bool = False,
-        on_exhaustion: bool | X = False,
-        jitter: N | tuple[N, N] = 0,
-        max_backoff: N = 0,
-        on_exception: None | OnEx | tuple[C, OnErrOpts] | Callable[..., Awaitable[Any]] = None,
-    ):
-        super().__init__(
-            expected_exception,
-            retries,
-            backoff,
-            exponential_backoff,
-            on_exhaustion,
-            jitter,
-            max_backoff,
-            sanitize_on_exception(on_exception, True),
-        )
+    is_async = True
 
     async def __call__(self, f: Callable[..., Awaitable[Any]], *args, **kwargs) -> Awaitable[Any]:
+        try:
+            return await f(*args, **kwargs)
+        except self.expected_exception as e:
+            exc = e
         return await retry_logic_async(
-            partial(f, *args, **kwargs),
+            f,
+            args,
+            kwargs,
+            exc,
             self.expected_exception,
-            self.retries,
-            self.backoff,
-            self.exponential_backoff,
+            self._retries,
             self.on_exhaustion,
-            self.jitter,
-            self.max_backoff,
-            self.on_exception,
+            self._delay,
+            self._onex_items,
+            self.drop_tb,
         )
@@ -134,6 +134,50 @@ def test_retry__on_exception(failed):
     # assert on_exception.call_count == 1
 
 
+def test_retry__drop_tb():
+    errors = [RuntimeError(), RuntimeError(), RuntimeError()]
+    failing = Mock(side_effect=errors)
+    failing.__name__ = "failing"
+    with pytest.raises(RuntimeError):
+        Retry(RuntimeError, retries=2)(failing)
+    assert [e.__traceback__ is None for e in errors] == [True, True, False]
+
+
+def test_retry__drop_tb_disabled():
+    errors = [RuntimeError(), RuntimeError()]
+    failing = Mock(side_effect=errors)
+    failing.__name__ = "failing"
+    with pytest.raises(RuntimeError):
+        Retry(RuntimeError, drop_tb=False)(failing)
+    assert all(e.__traceback__ is not None for e in errors)
+
+
+def test_retry__instances_have_no_dict():
+    assert not hasattr(Retry(), "__dict__")
+    assert not hasattr(RetryAsync(), "__dict__")
+
+
+def test_retry__config_is_read_only():
+    retry_inst = Retry(retries=2, backoff=BACKOFF)
+    for attr in ("retries", "backoff", "exponential_backoff", "jitter", "max_backoff", "on_exception"):
+        with pytest.raises(AttributeError):
+            setattr(retry_inst, attr, 5)
+    assert (retry_inst.retries, retry_inst.backoff) == (2, BACKOFF)
+
+
+def test_retry__on_exception_dict_changes_picked_up_by_new_instance(failed):
+    on_exception = {ValueError: Mock()}
+    Retry(on_exception=on_exception)
+    on_exception[RuntimeError] = Mock()
+    with pytest.raises(RuntimeError):
+        Retry(RuntimeError, on_exception=on_exception)(failed)
+    on_exception[RuntimeError].assert_called_once()
+
+    on_exception[TypeError] = "not callable"
+    with pytest.raises(TypeError):
+        Retry(on_exception=on_exception)
+
+
 @pytest.mark.asyncio()
 async def test_retry__on_exception__async(async_failed):
     on_exception = AsyncMock()
@@ -1,11 +1,14 @@
+import logging
 import statistics
 import time
 from collections.abc import Callable
-from unittest.mock import AsyncMock, Mock
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from retry_deco import retry
+from retry_deco import OnErrOpts, retry
+from retry_deco.retry import DELAY_FN_CACHE_SIZE, get_delay_fn, is_coroutine_fn, should_skip_cb
 
 BACKOFF = 0.002  # Base backoff parameter for tests.
 
@@ -134,6 +137,101 @@ def test_retry__max_backoff(failed):
     assert backoff * attempts < estimated_time < expected_time
 
 
+def test_delay_fn__shared_and_specialized():
+    delay = get_delay_fn(BACKOFF, True, BACKOFF * 4, 0, 5)
+    assert delay is get_delay_fn(BACKOFF, True, BACKOFF * 4, 0, 5)
+    assert [delay(c, 0) for c in range(1, 6)] == [BACKOFF, BACKOFF * 2, BACKOFF * 4, BACKOFF * 4, BACKOFF * 4]
+
+
+def test_delay_fn__cache_is_bounded():
+    for i in range(DELAY_FN_CACHE_SIZE * 2):
+        get_delay_fn(BACKOFF * (i + 1), False, 0, 0, 1)
+    assert get_delay_fn.cache_info().currsize <= DELAY_FN_CACHE_SIZE
+
+
+def test_delay_fn__exponent_capped_with_infinite_retries():
+    delay = get_delay_fn(BACKOFF, True, 0, 0, -1)
+    assert delay(3, 0) == BACKOFF * 4
+    assert delay(1000, 0) == BACKOFF * 2**63
+
+
+def test_delay_fn__jitter_range():
+    delay = get_delay_fn(BACKOFF, False, 0, (BACKOFF / 4, BACKOFF / 2), 1)
+    assert all(BACKOFF * 1.25 <= delay(1, 0) <= BACKOFF * 1.5 for _ in range(100))
+    delay = get_delay_fn(BACKOFF, False, 0, BACKOFF / 2, 1)
+    assert all(BACKOFF * 0.5 <= delay(1, 0) <= BACKOFF * 1.5 for _ in range(100))
+
+
+def test_delay_fn__decorrelated_jitter():
+    delay = get_delay_fn(BACKOFF, False, BACKOFF * 5, "decorrelated", 3)
+    prev = 0.0
+    for count in range(1, 50):
+        current = delay(count, prev)
+        assert BACKOFF <= current <= min(max(prev, BACKOFF) * 3, BACKOFF * 5)
+        prev = current
+
+
+def test_retry__decorrelated_jitter(failed):
+    attempts = 3
+    backoff = BACKOFF
+    decorator = retry(RuntimeError, retries=attempts - 1, backoff=backoff, jitter="decorrelated")
+    decorated = decorator(failed)
+    time_start = time.time()
+    with pytest.raises(RuntimeError):
+        decorated()
+    estimated_time = time.time() - time_start
+    assert backoff * 2 < estimated_time < backoff * 12 + backoff
+    assert failed.call_count == attempts
+
+
+def test_retry__decorrelated_jitter_excludes_exponential_backoff():
+    with pytest.raises(ValueError):
+        retry(backoff=BACKOFF, exponential_backoff=True, jitter="decorrelated")
+
+
+def test_retry__invalid_config_raises():
+    with pytest.raises(ValueError):
+        retry(backoff=-1)
+    with pytest.raises(ValueError):
+        retry(backoff=BACKOFF, jitter=BACKOFF * 2)
+    with pytest.raises(ValueError):
+        retry(backoff=BACKOFF, max_backoff=BACKOFF * 2)
+
+
+def test_retry__async_on_exception_for_sync_function_raises(failed):
+    with pytest.raises(TypeError):
+        retry(on_exception=AsyncMock())(failed)
+
+
+def test_retry__sleep_can_be_mocked(failed):
+    decorated = retry(RuntimeError, retries=2, backoff=0.3)(failed)
+    with patch("time.sleep") as sleep, pytest.raises(RuntimeError):
+        decorated()
+    assert sleep.call_count == 2
+
+
+def test_retry__no_sleep_without_backoff(failed):
+    decorated = retry(RuntimeError, retries=2)(failed)
+    with patch("time.sleep") as sleep, pytest.raises(RuntimeError):
+        decorated()
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_retry__sleep_can_be_mocked__async(async_failed):
+    decorated = retry(RuntimeError, retries=2, backoff=0.3)(async_failed)
+    with patch("asyncio.sleep") as sleep, pytest.raises(RuntimeError):
+        await decorated()
+    assert sleep.call_count == 2
+
+
+def test_retry__warning_log_can_be_mocked(failed):
+    decorated = retry(RuntimeError, retries=2)(failed)
+    with patch.object(logging.getLogger("retry_deco.retry"), "warning") as warning, pytest.raises(RuntimeError):
+        decorated()
+    assert warning.call_count == 3
+
+
 def test_retry__on_exception(failed):
     on_exception = Mock()
     decorator = retry(RuntimeError, retries=4, on_exception=on_exception)
@@ -143,6 +241,37 @@ def test_retry__on_exception(failed):
     assert on_exception.call_count == 4
 
 
+def test_retry__callback_errors_chained_to_caught_error(failed):
+    decorated = retry(RuntimeError, on_exception=Mock(side_effect=ValueError()))(failed)
+    with pytest.raises(ValueError) as exc_info:
+        decorated()
+    assert isinstance(exc_info.value.__context__, RuntimeError)
+
+    decorated = retry(RuntimeError, on_exhaustion=Mock(side_effect=ValueError()))(failed)
+    with pytest.raises(ValueError) as exc_info:
+        decorated()
+    assert isinstance(exc_info.value.__context__, RuntimeError)
+
+
+def test_is_coroutine_fn(failed, async_failed):
+    async def coro():
+        pass
+
+    assert is_coroutine_fn(coro)
+    assert is_coroutine_fn(partial(coro))
+    assert is_coroutine_fn(async_failed)
+    assert not is_coroutine_fn(test_is_coroutine_fn)
+    assert not is_coroutine_fn(failed)
+
+
+def test_should_skip_cb():
+    assert should_skip_cb(OnErrOpts(0), True)
+    assert not should_skip_cb(OnErrOpts(0), False)
+    assert not should_skip_cb(OnErrOpts.RUN_ON_LAST_TRY, True)
+    assert not should_skip_cb(OnErrOpts.RUN_ON_LAST_TRY.value, True)
+    assert should_skip_cb(OnErrOpts.BREAK_OUT.value, True)
+
+
 def test_0_retries__ok(failed):
     decorator = retry(RuntimeError, retries=0)
     decorated = decorator(failed)
@@ -161,6 +290,14 @@ async def test_retry__on_exception__async(async_failed):
     assert on_exception.call_count == 3
 
 
+@pytest.mark.asyncio()
+async def test_retry__callback_errors_chained_to_caught_error__async(async_failed):
+    decorated = retry(RuntimeError, on_exception=AsyncMock(side_effect=ValueError()))(async_failed)
+    with pytest.raises(ValueError) as exc_info:
+        await decorated()
+    assert isinstance(exc_info.value.__context__, RuntimeError)
+
+
 @retry(Exception, retries=3)
 def sync_retry_via_decorator(e_to_raise):
     raise e_to_raise()